@@ -1,26 +1,33 @@
 # Setup OpenAI Agent
 import os
-from llama_index.agent.openai import OpenAIAgent
-from llama_index.llms.openai import OpenAI
-from llama_index.tools.mcp import BasicMCPClient,McpToolSpec
 
 
-os.environ["OPENAI_API_KEY"] = "OpenAI KEY"
+def main():
+    # LlamaIndex pulls in a large dependency tree, so it is only imported once the example actually runs
+    from llama_index.agent.openai import OpenAIAgent
+    from llama_index.llms.openai import OpenAI
+    from llama_index.tools.mcp import BasicMCPClient,McpToolSpec
 
-mcp_client = BasicMCPClient("http://localhost:9090/sse")
-mcp_tool_spec = McpToolSpec(
-    client=mcp_client,    
-    # allowed_tools=["tool1", "tool2"] # Filter the tools by name
-)
+    os.environ["OPENAI_API_KEY"] = "OpenAI KEY"
 
-# sync
-tools = mcp_tool_spec.to_tool_list()
+    mcp_client = BasicMCPClient("http://localhost:9090/sse")
+    mcp_tool_spec = McpToolSpec(
+        client=mcp_client,    
+        # allowed_tools=["tool1", "tool2"] # Filter the tools by name
+    )
 
-llm = OpenAI(model="gpt-4o")
-agent = OpenAIAgent.from_tools(tools, llm=llm, verbose=True)
+    # sync
+    tools = mcp_tool_spec.to_tool_list()
 
-response1= agent.chat("what is the base url for the server")
-print(response1)
+    llm = OpenAI(model="gpt-4o")
+    agent = OpenAIAgent.from_tools(tools, llm=llm, verbose=True)
 
-response3 = agent.chat("Show me data from Staff table")
-print(response3)
\ No newline at end of file
+    response1= agent.chat("what is the base url for the server")
+    print(response1)
+
+    response3 = agent.chat("Show me data from Staff table")
+    print(response3)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,75 @@
 # Setup OpenAI Agent
 import os
+from typing import Optional
 import requests
-from llama_index.agent.openai import OpenAIAgent
-from llama_index.llms.openai import OpenAI
-from llama_index.tools.openapi import OpenAPIToolSpec
-from llama_index.tools.requests import RequestsToolSpec
-
-#That class is helping avoid issues with RequestsTool that sometimes did not do correct Get or Post requests due to missing headers
-class CustomRequestsToolSpec(RequestsToolSpec):
-    def get_request(self, url: str, headers: dict):
-
-        print("request headers", headers)
-        response = requests.get(url, headers=headers)
-        
-        full_response = {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "body": response.text
-        }
-        return full_response
 
-os.environ["OPENAI_API_KEY"] = "Your OpenAI API KEY"
 
-open_spec = OpenAPIToolSpec(
-    url="https://dev1.centralmind.ai/swagger/swagger_spec"
-)
+def main():
+    # LlamaIndex pulls in a large dependency tree, so it is only imported once the example actually runs
+    from llama_index.agent.openai import OpenAIAgent
+    from llama_index.llms.openai import OpenAI
+    from llama_index.tools.openapi import OpenAPIToolSpec
+    from llama_index.tools.requests import RequestsToolSpec
+    from llama_index.tools.requests.base import INVALID_URL_PROMPT
+
+    #That class is helping avoid issues with RequestsTool that sometimes did not do correct Get or Post requests due to missing headers
+    class CustomRequestsToolSpec(RequestsToolSpec):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Reuse connections across tool calls instead of opening a new one per request
+            self._session = requests.Session()
+
+        def get_request(self, url: str, headers: dict):
+
+            print("request headers", headers)
+            response = self._session.get(url, headers=headers)
+            
+            full_response = {
+                "status_code": response.status_code,
+                "headers": dict(response.headers),
+                "body": response.text
+            }
+            return full_response
+
+        def post_request(self, url: str, data: Optional[dict] = None):
+            """
+            Use this to POST content to a website.
+
+            Args:
+                url ([str]): The url to make the get request against
+                data (Optional[dict]): the key-value pairs to pass as the body of the request
+
+            """
+            # Same as the library method, only sent over the shared session
+            if not self._valid_url(url):
+                return INVALID_URL_PROMPT
 
-domain_headers = {
-    "https://dev1.centralmind.ai/": {
-        #"Authorization": "Bearer sk-your-key",
-        "Content-Type": "application/json"
+            response = self._session.post(url, headers=self._get_headers_for_url(url), json=data)
+            return response.json()
+
+    os.environ["OPENAI_API_KEY"] = "Your OpenAI API KEY"
+
+    open_spec = OpenAPIToolSpec(
+        url="https://dev1.centralmind.ai/swagger/swagger_spec"
+    )
+
+    domain_headers = {
+        "https://dev1.centralmind.ai/": {
+            #"Authorization": "Bearer sk-your-key",
+            "Content-Type": "application/json"
+        }
     }
-}
-requests_spec = CustomRequestsToolSpec(domain_headers=domain_headers)
+    requests_spec = CustomRequestsToolSpec(domain_headers=domain_headers)
+
+    llm = OpenAI(model="gpt-4o")
+    agent = OpenAIAgent.from_tools([*open_spec.to_tool_list(), *requests_spec.to_tool_list()], llm=llm, verbose=True)
+
+    response1= agent.chat("what is the base url for the server")
+    print(response1)
 
-llm = OpenAI(model="gpt-4o")
-agent = OpenAIAgent.from_tools([*open_spec.to_tool_list(), *requests_spec.to_tool_list()], llm=llm, verbose=True)
+    response3 = agent.chat("Show me top 10 from Films table")
+    print(response3)
 
-response1= agent.chat("what is the base url for the server")
-print(response1)
 
-response3 = agent.chat("Show me top 10 from Films table")
-print(response3)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
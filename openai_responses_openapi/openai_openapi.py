@@ -1,9 +1,21 @@
+import asyncio
 import json
-from typing import Dict, Any, List
-from openai import OpenAI
-from openapi_processor import OpenAPIProcessorForOpenAI  
+from typing import Dict, Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openapi_processor import OpenAPIProcessorForOpenAI
+
+async def execute_function_calls_async(processor: "OpenAPIProcessorForOpenAI", function_calls: List[Any]) -> List[Dict[str, Any]]:
+    # Independent calls from one model turn run concurrently, multiplexed over HTTP/2 only for https APIs
+    try:
+        return await asyncio.gather(*(processor.execute_function_call_async(fc) for fc in function_calls))
+    finally:
+        await processor.aclose()
 
 def main():
+    # The SDKs are imported here so loading this module stays fast
+    from openai import OpenAI
+    from openapi_processor import OpenAPIProcessorForOpenAI
 
     # Setting endpoints for OpenAPI spec and API
     spec_url = "http://dev1.centralmind.ai/swagger/swagger_spec"
@@ -34,19 +46,25 @@ def main():
     print("\nOpenAI Response:")
     print(response.output)
     
-    # Execute function call based on OpenAI's response
+    # Execute function calls based on OpenAI's response
     try:
-        result = processor.execute_function_call(response.output[0])
-        print("\nAPI Response:")
-        print(json.dumps(result, indent=2))
+        function_calls = [item for item in response.output if item.type == "function_call"]
+        if len(function_calls) > 1:
+            results = asyncio.run(execute_function_calls_async(processor, function_calls))
+        else:
+            results = [processor.execute_function_call(fc) for fc in function_calls]
         
-        # Add function call and result to messages
-        messages.append(response.output[0])  # Add function call
-        messages.append({  # Add function result
-            "type": "function_call_output",
-            "call_id": response.output[0].call_id,
-            "output": str(result)
-        })
+        for function_call, result in zip(function_calls, results):
+            print("\nAPI Response:")
+            print(json.dumps(result, indent=2))
+            
+            # Add function call and result to messages
+            messages.append(function_call)  # Add function call
+            messages.append({  # Add function result
+                "type": "function_call_output",
+                "call_id": function_call.call_id,
+                "output": str(result)
+            })
         
         # Get final response from OpenAI
         final_response = client.responses.create(model="gpt-4", input=messages, tools=functions)
@@ -1,7 +1,225 @@
+import functools
+import hashlib
 import json
+import os
+import string
+import tempfile
 from typing import Dict, Any, List
 import requests
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """Parse JSON using orjson when available, falling back to the stdlib json module."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON using orjson when available, falling back to the stdlib json module."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+_HTTP_METHODS = frozenset({"get", "post", "put", "delete", "patch", "head", "options", "trace"})
+
+# Methods whose application/json request body is exposed as the requestBody argument
+_BODY_METHODS = frozenset({"post", "put", "patch"})
+
+# Bump when the conversion output changes, so functions cached by older versions are not reused
+_FUNCTIONS_CACHE_VERSION = b"3"
+
+
+def _spec_hash(spec: Dict[str, Any], strict: bool) -> str | None:
+    """
+    Hash a parsed spec together with the conversion mode, used as the converted functions cache key.
+    
+    Returns None when the spec cannot be serialized, for example YAML-loaded values such as dates,
+    in which case the cache is skipped.
+    """
+    try:
+        if orjson is not None:
+            # YAML-loaded specs often use integer keys such as response codes. Keys are not sorted,
+            # the emitted functions, parameters and body fields follow spec order.
+            data = orjson.dumps(spec, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(spec, separators=(",", ":"), default=str).encode("utf-8")
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(b"strict" if strict else b"lenient")
+    digest.update(_FUNCTIONS_CACHE_VERSION)
+    return digest.hexdigest()
+
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "centralmind")
+
+
+def _make_session() -> requests.Session:
+    """Create a requests session that keeps connections alive and pools them per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _with_default(description: str, schema: Dict[str, Any]) -> str:
+    """Append the schema's default value to a parameter description, if it has one."""
+    if "default" not in schema:
+        return description
+    default_value = schema["default"]
+    return f"{description} (default: {default_value})" if description else f"Default value: {default_value}"
+
+
+def _build_prop(schema: Dict[str, Any], description: str) -> Dict[str, Any]:
+    """Build the property definition shared by path, query and request body fields."""
+    property_def = {
+        "type": schema.get("type", "string"),
+        "description": description
+    }
+    
+    # Add enum if present
+    if "enum" in schema:
+        property_def["enum"] = schema["enum"]
+    
+    return property_def
+
+
+def _url_base(api_url: str) -> str:
+    """Normalize an API base URL so operation paths without a leading slash can be appended to it."""
+    return api_url.rstrip("/") + "/"
+
+
+def _path_param_names(params: List[Dict[str, Any]]) -> frozenset[str]:
+    """Collect the names of the path parameters among resolved operation parameters."""
+    return frozenset(param.get("name", "") for param in params if param.get("in") == "path")
+
+
+def _index_entry(method: str, path: str, operation: Dict[str, Any], path_param_names: frozenset[str]) -> tuple:
+    """Build an operation index entry, see OpenAPIProcessorForOpenAI._op_index."""
+    return (method, path, operation, path_param_names, _compile_path(path.lstrip("/")))
+
+
+def _response_body(response: Any) -> Any:
+    """Decode a requests or httpx response: None for an empty body, parsed JSON, or the raw text otherwise."""
+    if response.status_code == 204 or not response.content:
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return response.text
+
+
+def _compile_path(path: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a path template like /films/{id} into (literal, parameter name) pairs once, for _format_path."""
+    return tuple((literal, field_name) for literal, field_name, _, _ in string.Formatter().parse(path))
+
+
+def _format_path(path_template: tuple[tuple[str, str | None], ...], arguments: Dict[str, Any]) -> str:
+    """Fill a path template compiled by _compile_path with argument values."""
+    return "".join(literal + (str(arguments[name]) if name else "") for literal, name in path_template)
+
+
+def _load_cached_functions(spec_hash: str) -> List[Dict[str, Any]] | None:
+    """Read converted functions for a spec hash from the disk cache, or None when they are not cached."""
+    path = os.path.join(_CACHE_DIR, f"functions-{spec_hash}.json")
+    try:
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file via a temporary file and os.replace, so readers never see a partial write."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _store_cached_functions(spec_hash: str, functions: List[Dict[str, Any]]) -> None:
+    """Write converted functions to the disk cache atomically, so concurrent runs never read a partial file."""
+    path = os.path.join(_CACHE_DIR, f"functions-{spec_hash}.json")
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        _write_atomic(path, _json_dumps(functions).encode("utf-8"))
+    except (OSError, TypeError):
+        pass
+
+
+# Specs are cached per URL across processor instances, so they are fetched with a shared session
+_spec_session = _make_session()
+# requests already negotiates gzip, only ask for the JSON representation of the spec
+_spec_session.headers.update({"Accept": "application/json"})
+
+
+@functools.lru_cache(maxsize=32)
+def _fetch_spec(url: str) -> bytes:
+    """
+    Download the raw OpenAPI specification, caching it in memory and on disk.
+    
+    The on-disk copy is revalidated with the server's ETag, so repeated runs only
+    transfer the spec again when it has changed.
+    
+    Args:
+        url (str): URL to the OpenAPI specification
+        
+    Returns:
+        bytes: Raw specification body
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    body_path = os.path.join(_CACHE_DIR, f"{key}.json")
+    etag_path = os.path.join(_CACHE_DIR, f"{key}.etag")
+    
+    headers = {}
+    if os.path.exists(body_path) and os.path.exists(etag_path):
+        with open(etag_path, "r", encoding="utf-8") as f:
+            headers["If-None-Match"] = f.read().strip()
+    
+    response = _spec_session.get(url, headers=headers)
+    if response.status_code == 304:
+        try:
+            with open(body_path, "rb") as f:
+                content = f.read()
+            _json_loads(content)
+            return content
+        except (OSError, ValueError):
+            # The cached body is gone or damaged, download the spec again unconditionally
+            response = _spec_session.get(url)
+    response.raise_for_status()
+    
+    content = response.content
+    etag = response.headers.get("ETag")
+    if etag:
+        # The disk cache is best-effort, a read-only home directory should not break downloads.
+        # The body is written first, so an ETag on disk always has a complete body next to it.
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            _write_atomic(body_path, content)
+            _write_atomic(etag_path, etag.encode("utf-8"))
+        except OSError:
+            pass
+    
+    return content
+
 
 class OpenAPIProcessorForOpenAI:
     """
@@ -20,6 +238,17 @@ class OpenAPIProcessorForOpenAI:
         self.spec_url = None
         self.openapi_spec = None
         self.functions = None
+        # operationId -> (method, path, operation, path parameter names, compiled path template without the leading slash),
+        # built by convert_openapi_to_functions or _build_op_index
+        self._op_index: Dict[str, tuple[str, str, Dict[str, Any], frozenset[str], tuple]] = {}
+        self._op_index_spec = None
+        # $ref -> resolved node for the spec currently being converted
+        self._ref_cache: Dict[str, Dict[str, Any]] = {}
+        self._ref_spec = None
+        # id(request body schema) -> (properties, required), shared schemas are converted once per spec
+        self._body_schema_cache: Dict[int, tuple[Dict[str, Any], List[str]]] = {}
+        self._session = _make_session()
+        self._async_client = None
         
         if spec_url_or_json:
             if isinstance(spec_url_or_json, str):
@@ -27,6 +256,142 @@ class OpenAPIProcessorForOpenAI:
             else:
                 self.openapi_spec = spec_url_or_json
     
+    @property
+    def api_url(self) -> str | None:
+        """
+        Base URL of the API.
+        """
+        return self._api_url
+    
+    @api_url.setter
+    def api_url(self, value: str | None) -> None:
+        self._api_url = value
+        # Operation paths are appended to this directly instead of going through urljoin on every call
+        self._api_url_base = _url_base(value) if value else None
+    
+    def _lookup(self, ref: str) -> Dict[str, Any]:
+        """
+        Find the node a local JSON pointer such as #/components/schemas/Film points to.
+        
+        Args:
+            ref (str): Value of a $ref field
+            
+        Returns:
+            Dict[str, Any]: Referenced node, or an empty dict if it cannot be found
+        """
+        # Only references inside the same document are supported
+        if not ref.startswith("#/"):
+            return {}
+        
+        node = self._ref_spec
+        for token in ref[2:].split("/"):
+            token = token.replace("~1", "/").replace("~0", "~")
+            if not isinstance(node, dict) or token not in node:
+                return {}
+            node = node[token]
+        
+        return node if isinstance(node, dict) else {}
+    
+    def _resolve(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace a $ref node with the node it references, following chained references.
+        
+        Each reference is resolved once per spec, later lookups are served from the cache.
+        
+        Args:
+            node (Dict[str, Any]): Node that may contain a $ref field
+            
+        Returns:
+            Dict[str, Any]: Resolved node, or the node itself if it is not a reference
+        """
+        if "$ref" not in node:
+            return node
+        
+        ref = node["$ref"]
+        resolved = self._ref_cache.get(ref)
+        if resolved is None:
+            # Mark the reference before descending so circular references terminate
+            self._ref_cache[ref] = {}
+            resolved = self._ref_cache[ref] = self._resolve(self._lookup(ref))
+        
+        return resolved
+    
+    def _use_spec(self, openapi_spec: Dict[str, Any]) -> None:
+        """
+        Point reference resolution at a spec, clearing the per-spec caches when it changes.
+        
+        Args:
+            openapi_spec (Dict[str, Any]): OpenAPI specification about to be walked
+        """
+        if openapi_spec is not self._ref_spec:
+            self._ref_cache = {}
+            self._body_schema_cache = {}
+            self._ref_spec = openapi_spec
+    
+    def _build_op_index(self, openapi_spec: Dict[str, Any]) -> None:
+        """
+        Build only the operation index for a spec, without converting it to functions.
+        
+        Used when the functions come from the cache or a call targets a spec that was not converted.
+        
+        Args:
+            openapi_spec (Dict[str, Any]): OpenAPI specification as a dictionary
+        """
+        self._use_spec(openapi_spec)
+        
+        op_index = {}
+        for path, path_item in openapi_spec.get("paths", {}).items():
+            for method in [key for key in path_item if key in _HTTP_METHODS]:
+                operation = path_item[method]
+                if not operation:
+                    continue
+                
+                params = [param for param in map(self._resolve, operation.get("parameters", [])) if param.get("in") == "path"]
+                op_index[operation.get("operationId", "")] = _index_entry(method, path, operation, _path_param_names(params))
+        
+        self._op_index = op_index
+        self._op_index_spec = openapi_spec
+    
+    def _build_body_schema(self, schema: Dict[str, Any]) -> tuple[Dict[str, Any], List[str]]:
+        """
+        Convert a resolved request body schema into function properties and required names.
+        
+        Schemas reached through the same $ref are the same object, so the result is cached by identity.
+        This is safe because the spec that owns them stays referenced for as long as the cache lives.
+        
+        Args:
+            schema (Dict[str, Any]): Resolved request body schema
+            
+        Returns:
+            tuple[Dict[str, Any], List[str]]: Body properties and the names of required body properties.
+            The result is shared by every operation that uses the schema, so callers must copy it.
+        """
+        # Fast path for schemas without fields, such as free-form objects
+        if "properties" not in schema:
+            return {}, []
+        
+        key = id(schema)
+        cached = self._body_schema_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        body_properties = {}
+        body_required = []
+        schema_properties = schema["properties"] or {}
+        schema_required = frozenset(schema.get("required") or ())
+        
+        # Extract properties from schema
+        for prop_name, prop_schema in schema_properties.items():
+            prop_schema = self._resolve(prop_schema)
+            body_properties[prop_name] = _build_prop(prop_schema, prop_schema.get("description", ""))
+            
+            # Add to required if specified
+            if prop_name in schema_required:
+                body_required.append(prop_name)
+        
+        cached = self._body_schema_cache[key] = (body_properties, body_required)
+        return cached
+    
     def convert_openapi_to_functions(self, openapi_spec: Dict[str, Any], strict: bool = False) -> List[Dict[str, Any]]:
         """
         Convert OpenAPI 3.1 spec to OpenAI function calling format.
@@ -38,7 +403,9 @@ class OpenAPIProcessorForOpenAI:
         Returns:
             List[Dict[str, Any]]: List of OpenAI function definitions
         """
-        functions = []
+        op_index = {}
+        
+        self._use_spec(openapi_spec)
         
         # Extract paths from OpenAPI spec
         paths = openapi_spec.get("paths", {})
@@ -49,141 +416,89 @@ class OpenAPIProcessorForOpenAI:
         parameters = components.get("parameters", {})
         request_bodies = components.get("requestBodies", {})
         
-        for path, path_item in paths.items():
-            # Process all HTTP methods
-            for method in ["get", "post", "put", "delete", "patch", "head", "options", "trace"]:
-                operation = path_item.get(method)
-                if not operation:
-                    continue
+        def build_param_prop(param: Dict[str, Any]) -> Dict[str, Any]:
+            # Property definition for a path or query parameter
+            param_schema = self._resolve(param.get("schema", {}))
+            property_def = _build_prop(param_schema, _with_default(param.get("description", ""), param_schema))
+            
+            # Handle optional query parameters in non-strict mode
+            if param["in"] == "query" and not strict and not param.get("required", False):
+                # Make the type a list to include null, copying so the schema itself is left untouched
+                param_type = property_def["type"]
+                if isinstance(param_type, str):
+                    property_def["type"] = [param_type, "null"]
+                else:
+                    property_def["type"] = [*param_type, "null"]
+            
+            return property_def
+        
+        def iter_functions():
+            # Yield one function definition per operation, recording it in the operation index
+            for path, path_item in paths.items():
+                # Process the HTTP methods present in the path item, in spec order
+                for method in [key for key in path_item if key in _HTTP_METHODS]:
+                    operation = path_item[method]
+                    if not operation:
+                        continue
                     
-                # Extract operation details
-                operation_id = operation.get("operationId", "")
-                description = operation.get("description", "")
-                parameters_list = operation.get("parameters", [])
-                request_body = operation.get("requestBody")
-                responses = operation.get("responses", {})
-                
-                # Create function parameters schema
-                properties = {}
-                required = []
-                
-                # Add path parameters
-                for param in parameters_list:
-                    if param.get("in") == "path":
-                        param_name = param.get("name", "")
-                        param_schema = param.get("schema", {})
-                        
-                        # Handle parameter type
-                        param_type = param_schema.get("type", "string")
-                        
-                        # Create property definition with description
-                        description = param.get("description", "")
-                        if "default" in param_schema:
-                            default_value = param_schema["default"]
-                            description = f"{description} (default: {default_value})" if description else f"Default value: {default_value}"
-                        
-                        property_def = {
-                            "type": param_type,
-                            "description": description
-                        }
-                        
-                        # Add enum if present
-                        if "enum" in param_schema:
-                            property_def["enum"] = param_schema["enum"]
-                        
-                        properties[param_name] = property_def
-                        required.append(param_name)  # Path parameters are always required
-                
-                # Add query parameters
-                for param in parameters_list:
-                    if param.get("in") == "query":
-                        param_name = param.get("name", "")
-                        param_schema = param.get("schema", {})
-                        
-                        # Handle parameter type
-                        param_type = param_schema.get("type", "string")
-                        
-                        # Create property definition with description
-                        description = param.get("description", "")
-                        if "default" in param_schema:
-                            default_value = param_schema["default"]
-                            description = f"{description} (default: {default_value})" if description else f"Default value: {default_value}"
-                        
-                        property_def = {
-                            "type": param_type,
-                            "description": description
-                        }
-                        
-                        # Add enum if present
-                        if "enum" in param_schema:
-                            property_def["enum"] = param_schema["enum"]
-                        
-                        # Handle optional parameters in strict mode
-                        if not strict and not param.get("required", False):
-                            # Make the type a list to include null
-                            if isinstance(property_def["type"], str):
-                                property_def["type"] = [property_def["type"], "null"]
-                            else:
-                                property_def["type"].append("null")
-                        
-                        properties[param_name] = property_def
-                        # In strict mode, all parameters are required
-                        if strict or param.get("required", False):
-                            required.append(param_name)
-                
-                # Add request body for POST/PUT methods
-                if request_body and method in ["post", "put", "patch"]:
-                    content = request_body.get("content", {})
-                    if "application/json" in content:
-                        schema = content["application/json"].get("schema", {})
-                        if isinstance(schema, dict):
-                            # Handle request body schema
-                            body_properties = {}
-                            body_required = []
-                            
-                            # Extract properties from schema
-                            for prop_name, prop_schema in schema.get("properties", {}).items():
-                                prop_type = prop_schema.get("type", "string")
-                                prop_description = prop_schema.get("description", "")
+                    # Extract operation details
+                    operation_id = operation.get("operationId", "")
+                    operation_description = operation.get("description", "")
+                    parameters_list = operation.get("parameters", [])
+                    request_body = operation.get("requestBody")
+                    if request_body:
+                        request_body = self._resolve(request_body)
+                    responses = operation.get("responses", {})
+                    
+                    # Path parameters are always required, in strict mode all parameters are required
+                    params = [param for param in map(self._resolve, parameters_list) if param.get("in") in ("path", "query")]
+                    properties = {param.get("name", ""): build_param_prop(param) for param in params}
+                    required = [
+                        param.get("name", "") for param in params
+                        if param["in"] == "path" or strict or param.get("required", False)
+                    ]
+                    path_param_names = _path_param_names(params)
+                    
+                    # Add request body for POST/PUT methods
+                    if request_body and method in _BODY_METHODS:
+                        content = request_body.get("content") or {}
+                        json_content = content.get("application/json")
+                        if json_content is not None:
+                            schema = json_content.get("schema") or {}
+                            if isinstance(schema, dict):
+                                # Handle request body schema
+                                body_properties, body_required = self._build_body_schema(self._resolve(schema))
                                 
-                                property_def = {
-                                    "type": prop_type,
-                                    "description": prop_description
+                                # Add request body as a single parameter, copying the cached definitions
+                                # so functions sharing a schema do not share mutable objects
+                                properties["requestBody"] = {
+                                    "type": "object",
+                                    "description": request_body.get("description", "Request body"),
+                                    "properties": {name: dict(prop) for name, prop in body_properties.items()},
+                                    "required": list(body_required)
                                 }
-                                
-                                # Add enum if present
-                                if "enum" in prop_schema:
-                                    property_def["enum"] = prop_schema["enum"]
-                                
-                                body_properties[prop_name] = property_def
-                                
-                                # Add to required if specified
-                                if prop_name in schema.get("required", []):
-                                    body_required.append(prop_name)
-                            
-                            # Add request body as a single parameter
-                            properties["requestBody"] = {
-                                "type": "object",
-                                "description": request_body.get("description", "Request body"),
-                                "properties": body_properties,
-                                "required": body_required if strict else body_required
-                            }
-                            required.append("requestBody")
-                
-                # Create function definition
-                function_def = {
-                    "type": "function",
-                    "name": operation_id,
-                    "description": description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": properties,
-                        "required": required if strict else required,
-                        "additionalProperties": False  # Required for strict mode
+                                required.append("requestBody")
+                    
+                    # Create function definition
+                    function_def = {
+                        "type": "function",
+                        "name": operation_id,
+                        "description": operation_description,
+                        "parameters": {
+                            "type": "object",
+                            "properties": properties,
+                            "required": required,
+                            "additionalProperties": False  # Required for strict mode
+                        }
                     }
-                }
-                
-                functions.append(function_def)
+                    
+                    op_index[operation_id] = _index_entry(method, path, operation, path_param_names)
+                    yield function_def
+        
+        functions = list(iter_functions())
+        
+        self._op_index = op_index
+        self._op_index_spec = openapi_spec
         
         return functions
     
@@ -204,13 +519,12 @@ class OpenAPIProcessorForOpenAI:
             raise ValueError("No spec_url provided and no URL found in instance")
             
         try:
-            response = requests.get(url_to_use)
-            response.raise_for_status()
-            
-            spec = response.json()
+            content = _fetch_spec(url_to_use)
+            spec = _json_loads(content)
             
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(spec, f, indent=2, ensure_ascii=False)
+            # Save the downloaded bytes as-is instead of re-serializing the parsed spec
+            with open(output_file, "wb") as f:
+                f.write(content)
             print(f"OpenAPI specification downloaded and saved to {output_file}")
             
             return spec
@@ -226,7 +540,7 @@ class OpenAPIProcessorForOpenAI:
             output_file (str): Output file path
         """
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(self.functions, f, indent=2, ensure_ascii=False)
+            f.write(_json_dumps(self.functions))
     
     def process_openapi_spec(self, spec_url_or_json: str | Dict[str, Any] | None = None, strict: bool = True) -> List[Dict[str, Any]]:
         """
@@ -255,8 +569,16 @@ class OpenAPIProcessorForOpenAI:
         if not self.openapi_spec:
             raise ValueError("No OpenAPI specification provided")
         
-        # Convert to OpenAI functions
-        self.functions = self.convert_openapi_to_functions(self.openapi_spec, strict=strict)
+        # Convert to OpenAI functions, reusing an earlier conversion of identical spec content.
+        # On a cache hit only the lightweight operation index is built.
+        spec_hash = _spec_hash(self.openapi_spec, strict)
+        self.functions = _load_cached_functions(spec_hash) if spec_hash else None
+        if self.functions is None:
+            self.functions = self.convert_openapi_to_functions(self.openapi_spec, strict=strict)
+            if spec_hash:
+                _store_cached_functions(spec_hash, self.functions)
+        else:
+            self._build_op_index(self.openapi_spec)
         
         # Save to file
         self.save_functions_to_file()
@@ -264,9 +586,9 @@ class OpenAPIProcessorForOpenAI:
         
         return self.functions
     
-    def execute_function_call(self, function_call: Any, api_url: str | None = None, openapi_spec: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    def _prepare_request(self, function_call: Any, api_url: str | None = None, openapi_spec: Dict[str, Any] | None = None) -> tuple[str, str, Dict[str, Any], Any]:
         """
-        Execute HTTP request based on OpenAI's function call response.
+        Resolve OpenAI's function call response into the HTTP request to send.
         
         Args:
             function_call: OpenAI's function call response
@@ -274,11 +596,10 @@ class OpenAPIProcessorForOpenAI:
             openapi_spec (Dict[str, Any] | None): OpenAPI specification. If provided, overrides the instance value
             
         Returns:
-            Dict[str, Any]: Response from the API
+            tuple[str, str, Dict[str, Any], Any]: HTTP method, full URL, query parameters and JSON body
         """
         # Use provided URL or fall back to instance URL
-        url_to_use = api_url or self.api_url
-        if not url_to_use:
+        if not api_url and not self._api_url_base:
             raise ValueError("No api_url provided and no URL found in instance")
             
         # Use provided spec or fall back to instance spec
@@ -288,41 +609,85 @@ class OpenAPIProcessorForOpenAI:
             
         # Extract function name and arguments
         function_name = function_call.name
-        arguments = json.loads(function_call.arguments)
-        
-        # Find the matching path and operation in OpenAPI spec
-        paths = spec_to_use.get("paths", {})
-        matching_path = None
-        matching_operation = None
-        
-        for path, path_item in paths.items():
-            for method, operation in path_item.items():
-                if method.lower() == "get" and operation.get("operationId") == function_name:
-                    matching_path = path
-                    matching_operation = operation
-                    break
-            if matching_path:
-                break
-        
-        if not matching_path:
+        arguments = _json_loads(function_call.arguments)
+        
+        # Look up the operation, indexing the spec first if it has not been indexed yet
+        if spec_to_use is not self._op_index_spec:
+            self._build_op_index(spec_to_use)
+        
+        if function_name not in self._op_index:
             raise ValueError(f"Unknown function: {function_name}")
+        method, matching_path, matching_operation, path_param_names, path_template = self._op_index[function_name]
+        
+        # Substitute path parameters and pass everything else as query parameters, skipping unset optional ones
+        try:
+            path_suffix = _format_path(path_template, arguments)
+        except KeyError as e:
+            raise ValueError(f"Missing path parameter '{e.args[0]}' for function: {function_name}") from None
+        body = arguments.get("requestBody")
+        query_params = {k: v for k, v in arguments.items() if k not in path_param_names and k != "requestBody" and v is not None}
         
-        # Replace path parameters in the endpoint
-        endpoint = matching_path
-        query_params = arguments.copy()  # Create a copy for query parameters
+        # Construct the full URL, joining per-call overrides the same way as the instance URL
+        url = (_url_base(api_url) if api_url else self._api_url_base) + path_suffix
         
-        # Process path parameters
-        for key, value in arguments.items():
-            if key in endpoint:
-                endpoint = endpoint.replace(f"{{{key}}}", str(value))
-                del query_params[key]  # Remove path parameters from query parameters
+        return method.upper(), url, query_params, body
+    
+    def execute_function_call(self, function_call: Any, api_url: str | None = None, openapi_spec: Dict[str, Any] | None = None) -> Any:
+        """
+        Execute HTTP request based on OpenAI's function call response.
         
-        # Construct the full URL
-        url = urljoin(url_to_use, endpoint)
+        Args:
+            function_call: OpenAI's function call response
+            api_url (str | None): Base URL of the API. If provided, overrides the instance value
+            openapi_spec (Dict[str, Any] | None): OpenAPI specification. If provided, overrides the instance value
+            
+        Returns:
+            Any: Parsed JSON response from the API, the response text if it is not JSON, or None if it is empty
+        """
+        method, url, query_params, body = self._prepare_request(function_call, api_url, openapi_spec)
         
         # Make the HTTP request
         print(url)
-        response = requests.get(url, params=query_params)
+        response = self._session.request(method, url, params=query_params, json=body)
         response.raise_for_status()  # Raise an exception for bad status codes
         
-        return response.json() 
\ No newline at end of file
+        return _response_body(response)
+    
+    async def execute_function_call_async(self, function_call: Any, api_url: str | None = None, openapi_spec: Dict[str, Any] | None = None) -> Any:
+        """
+        Execute HTTP request based on OpenAI's function call response without blocking the event loop.
+        
+        Several calls can be awaited together with asyncio.gather and run concurrently. They are multiplexed
+        over one HTTP/2 connection per host only for https URLs, plain http uses a pool of HTTP/1.1 connections.
+        
+        Args:
+            function_call: OpenAI's function call response
+            api_url (str | None): Base URL of the API. If provided, overrides the instance value
+            openapi_spec (Dict[str, Any] | None): OpenAPI specification. If provided, overrides the instance value
+            
+        Returns:
+            Any: Parsed JSON response from the API, the response text if it is not JSON, or None if it is empty
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for async function calls, install it with: pip install \"httpx[http2]\"")
+        
+        method, url, query_params, body = self._prepare_request(function_call, api_url, openapi_spec)
+        
+        # The client is created lazily so it binds to the running event loop
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_connections=32))
+        
+        # Make the HTTP request
+        print(url)
+        response = await self._async_client.request(method, url, params=query_params, json=body)
+        response.raise_for_status()  # Raise an exception for bad status codes
+        
+        return _response_body(response)
+    
+    async def aclose(self) -> None:
+        """
+        Close the async HTTP client used by execute_function_call_async.
+        """
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None